@@ -1,48 +1,161 @@
-from flask import Flask, jsonify, request, session, render_template
-from flask_restful import Api, Resource
+from flask import (
+    Blueprint,
+    Flask,
+    Response,
+    jsonify,
+    request,
+    session,
+    render_template,
+    stream_with_context,
+)
 from flask_migrate import Migrate
 from flask_cors import CORS
 from werkzeug.exceptions import NotFound
-from models.models import User, Order, Parcel, Profile, Feedback
+from models.models import User, Order, Parcel, Profile, Feedback, TableVersion
 from models.database import db
+from json_provider import ORJSONProvider
+from bloom import BloomFilter
+from schemas import (
+    FeedbackBulkItem,
+    LoginIn,
+    OrderBulkItem,
+    OrderPatch,
+    PageArgs,
+    ParcelBulkItem,
+    ParcelPatch,
+    ProfilePatch,
+    SignupIn,
+    validation_error,
+)
+from pydantic import ValidationError
+from sqlalchemy import event, func, insert, select, update
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, raiseload, selectinload
 from flask_bcrypt import Bcrypt
 import datetime
 import jwt
+import logging
 import os
+import sqlite3
 import hashlib
+import hmac
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from bcrypt import gensalt, hashpw
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
 
-app = Flask(
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+logger = logging.getLogger(__name__)
+
+
+class SendItFlask(Flask):
+    json_provider_class = ORJSONProvider
+
+
+app = SendItFlask(
     __name__,
     static_url_path="",
     static_folder="../client/build",
     template_folder="../client/build",
 )
 
-print(f'{os.getenv("DATABASE_NAME")}')
-# Check for DATABASE_URI and SECRET_KEY
-if not os.getenv("DATABASE_NAME"):
-    raise ValueError("DATABASE_NAME not set in .env file")
+# Check for DATABASE_URL/DATABASE_NAME and SECRET_KEY
+if not os.getenv("DATABASE_URL") and not os.getenv("DATABASE_NAME"):
+    raise ValueError("DATABASE_URL or DATABASE_NAME not set in .env file")
 if not os.getenv("SECRET_KEY"):
     raise ValueError("SECRET_KEY not set in .env file")
 
-database_path = os.path.join(
-    os.path.dirname(__file__), "instance", f"{os.getenv('DATABASE_NAME')}"
-)
+if os.getenv("DATABASE_URL"):
+    # A real server database (PostgreSQL) with a pool of reusable connections
+    database_uri = os.getenv("DATABASE_URL")
+    if database_uri.startswith("postgres://"):
+        database_uri = database_uri.replace("postgres://", "postgresql://", 1)
+    app.config["SQLALCHEMY_DATABASE_URI"] = database_uri
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "pool_size": int(os.getenv("DATABASE_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DATABASE_MAX_OVERFLOW", "10")),
+        "pool_pre_ping": True,
+    }
+else:
+    database_path = os.path.join(
+        os.path.dirname(__file__), "instance", f"{os.getenv('DATABASE_NAME')}"
+    )
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{database_path}"
+
+# str() of a URL masks the password
+logger.debug("Using database %s", make_url(app.config["SQLALCHEMY_DATABASE_URI"]))
+
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers run alongside the single SQLite writer
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
 
-app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{database_path}"
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 app.config["SECRET_KEY"] = os.getenv("SECRET_KEY")
 app.config["SESSION_TYPE"] = "filesystem"
 
+
+def calibrate_bcrypt_rounds(target_seconds, min_rounds=10, max_rounds=15):
+    """Return the highest bcrypt cost that hashes within ``target_seconds``."""
+    rounds = min_rounds
+    for cost in range(min_rounds, max_rounds + 1):
+        start = time.perf_counter()
+        hashpw(b"calibration", gensalt(cost))
+        if time.perf_counter() - start > target_seconds:
+            break
+        rounds = cost
+    return rounds
+
+
+# An explicit BCRYPT_LOG_ROUNDS wins; otherwise pick the cost for this CPU
+app.config["BCRYPT_LOG_ROUNDS"] = int(
+    os.getenv("BCRYPT_LOG_ROUNDS")
+    or calibrate_bcrypt_rounds(float(os.getenv("BCRYPT_TARGET_SECONDS", "0.25")))
+)
+logger.info("Using bcrypt cost %d", app.config["BCRYPT_LOG_ROUNDS"])
+
 db.init_app(app)
 bcrypt = Bcrypt(app)
 migrate = Migrate(app, db)
 CORS(app, supports_credentials=True)
 
-api = Api(app)
+
+# bcrypt drops the GIL while hashing, so a thread pool keeps hashing off the
+# request threads. BCRYPT_POOL_SIZE is this process's share of the cores;
+# gunicorn.conf.py divides them between the workers.
+def new_bcrypt_pool():
+    size = int(os.getenv("BCRYPT_POOL_SIZE") or os.cpu_count() or 1)
+    return ThreadPoolExecutor(max_workers=size, thread_name_prefix="bcrypt")
+
+
+BCRYPT_POOL = new_bcrypt_pool()
+
+
+def reset_bcrypt_pool():
+    """Give a forked worker its own pool; executor threads do not survive fork."""
+    global BCRYPT_POOL
+    BCRYPT_POOL = new_bcrypt_pool()
+
+
+# Development aid: with RAISE_ON_LAZY_LOAD=1, a relationship the list endpoints
+# did not eager-load raises instead of silently issuing one SELECT per row
+app.config["RAISE_ON_LAZY_LOAD"] = os.getenv("RAISE_ON_LAZY_LOAD") == "1"
+
+api = Blueprint("api", __name__)
 
 
 @app.errorhandler(404)
@@ -60,215 +173,578 @@ def handle_not_found(e):
     )
 
 
-class Index(Resource):
-    def get(self):
-        return {"index": "Welcome to Sendit"}
+async def run_in_thread(func, *args):
+    """Backport of ``asyncio.to_thread`` (3.9+) for Python 3.8."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args)
+    return await loop.run_in_executor(None, call)
 
 
-class UserResource(Resource):
-    def post(self):
-        if request.is_json:
-            if request.path.endswith("/login"):
-                return self.login()
-            elif request.path.endswith("/logout"):
-                return self.logout()
-            else:
-                return self.register()
-        else:
-            return {"error": "Invalid JSON format"}, 400
+async def hash_password(password):
+    future = BCRYPT_POOL.submit(
+        bcrypt.generate_password_hash, password, app.config["BCRYPT_LOG_ROUNDS"]
+    )
+    return (await asyncio.wrap_future(future)).decode("utf-8")
 
-    def register(self):
-        data = request.get_json()
-        username = data.get("username")
-        email = data.get("email")
-        password = data.get("password")
-        role = data.get("role", "user")  # Default to 'user' if not provided
 
-        if not username or not email or not password:
-            return {"error": "Missing fields"}, 400
+DUMMY_HASH = bcrypt.generate_password_hash(
+    "dummy", app.config["BCRYPT_LOG_ROUNDS"]
+).decode("utf-8")
 
-        if User.query.filter_by(email=email).first():
-            return {"error": "Email already exists"}, 400
 
-        hashed_password = hashlib.sha256(password.encode("utf-8")).hexdigest()
-        new_user = User(
-            username=username, email=email, role=role, hashed_password=hashed_password
-        )
-        db.session.add(new_user)
-        db.session.commit()
-        return {"user": new_user.to_dict()}, 201
-
-    def login(self):
-        data = request.get_json()
-        email = data.get("email")
-        password = data.get("password")
-
-        user = User.query.filter_by(email=email).first()
-        hashed_password = hashlib.sha256(password.encode("utf-8")).hexdigest()
-        if user and user.hashed_password == hashed_password:
-            session["user_id"] = user.id
-            token = jwt.encode(
-                {
-                    "identity": user.id,
-                    "exp": datetime.datetime.utcnow() + datetime.timedelta(hours=1),
-                },
-                app.config["SECRET_KEY"],
-                algorithm="HS256",
-            )
+# One JWS instance and pre-encoded key shared by every login
+JWS = jwt.PyJWS(algorithms=["HS256"])
+SIGNING_KEY = app.config["SECRET_KEY"].encode("utf-8")
+ACCESS_TOKEN_TTL = datetime.timedelta(hours=1)
+REFRESH_TOKEN_TTL = datetime.timedelta(days=30)
 
-            refresh_token = jwt.encode(
-                {
-                    "identity": user.id,
-                    "exp": datetime.datetime.utcnow() + datetime.timedelta(days=30),
-                },
-                app.config["SECRET_KEY"],
-                algorithm="HS256",
-            )
 
-            return {"token": token, "refresh_token": refresh_token}, 200
+def encode_token(identity, expires_at):
+    claims = {"identity": identity, "exp": int(expires_at.timestamp())}
+    payload = app.json.encode(claims)
+    return JWS.encode(payload, SIGNING_KEY, algorithm="HS256")
 
-        return {"error": "Invalid credentials"}, 401
 
-    def logout(self):
-        session.pop("user_id", None)
-        return {"message": "Logged out successfully"}, 200
+def is_legacy_hash(hashed_password):
+    return not hashed_password.startswith("$2")
 
 
-class OrderResource(Resource):
-    def post(self):
-        data = request.get_json()
-        new_order = Order(
-            user_id=data["user_id"],
-            parcel_id=data["parcel_id"],
-            origin=data["origin"],
-            destination=data["destination"],
-            status=data.get("status", "pending"),
+async def check_password(hashed_password, password):
+    legacy = is_legacy_hash(hashed_password)
+    # Accounts created before the move to bcrypt store a bare SHA-256 digest;
+    # they still pay for a bcrypt check so their timing matches every other
+    # login and does not reveal that the account exists
+    future = BCRYPT_POOL.submit(
+        bcrypt.check_password_hash, DUMMY_HASH if legacy else hashed_password, password
+    )
+    matches = await asyncio.wrap_future(future)
+    if legacy:
+        digest = hashlib.sha256(password.encode("utf-8")).hexdigest()
+        return hmac.compare_digest(hashed_password, digest)
+    return matches
+
+
+def eager(*loads):
+    """Loader options for a listing that eager-loads ``loads``.
+
+    Each load must be a separate option per level so that, when
+    RAISE_ON_LAZY_LOAD is set, every level gets its own ``raiseload("*")``.
+    """
+    if not app.config["RAISE_ON_LAZY_LOAD"]:
+        return loads
+    return (*loads, raiseload("*"), *(load.raiseload("*") for load in loads))
+
+
+def column_dict(model, row):
+    """Render a projected row's columns the way ``model.to_dict()`` does.
+
+    Datetimes keep SerializerMixin's naive ``datetime_format``; left to
+    orjson they would be sent as ISO strings claiming to be UTC.
+    """
+    return {
+        key: (
+            value.strftime(model.datetime_format)
+            if isinstance(value, datetime.datetime)
+            else value
         )
-        db.session.add(new_order)
-        db.session.commit()
-        return {"message": "Order created", "order": new_order.to_dict()}, 201
-
-    def get(self, order_id=None):
-        if order_id:
-            order = Order.query.get(order_id)
-            if order:
-                return {"order": order.to_dict()}
-            return {"error": "Order not found"}, 404
-
-        orders = Order.query.all()
-        return {"orders": [order.to_dict() for order in orders]}
-
-    def patch(self, order_id):
-        order = Order.query.get(order_id)
-        if not order:
-            return {"error": "Order not found"}, 404
-        data = request.get_json()
-        if "status" in data:
-            order.status = data["status"]
-        db.session.commit()
-        return {"message": "Order updated", "order": order.to_dict()}, 200
+        for key, value in row.items()
+    }
+
+
+class RegisteredEmails:
+    """Bloom filter of registered emails used to reject unknown logins early.
+
+    Other workers can register users this process never saw, so a miss is
+    only trusted once ``MAX(users.id)`` shows nothing was added since the
+    filter was last topped up. That primary key lookup is far cheaper than
+    fetching the user row by email. The queries run outside the lock, which
+    only guards the filter itself.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bloom = None
+        self.high_water = 0
+
+    def _top_up(self, latest):
+        """Add the users up to id ``latest`` that the filter has not seen."""
+        with self.lock:
+            bloom, since_id = self.bloom, self.high_water
+        if bloom is None or bloom.is_full():
+            bloom, since_id = BloomFilter(capacity=max(1024, latest * 2)), 0
+        emails = db.session.scalars(
+            select(func.lower(User.email)).where(User.id > since_id, User.id <= latest)
+        ).all()
+        with self.lock:
+            for email in emails:
+                bloom.add(email)
+            if bloom is self.bloom:
+                self.high_water = max(self.high_water, latest)
+            elif latest >= self.high_water:
+                self.bloom, self.high_water = bloom, latest
+        return bloom
+
+    def add(self, email):
+        # Only this worker's own signups; high_water is left to _top_up so
+        # lower ids committed by other workers are not skipped
+        with self.lock:
+            if self.bloom is not None:
+                self.bloom.add(email)
+
+    def might_exist(self, email):
+        with self.lock:
+            bloom, high_water = self.bloom, self.high_water
+            if bloom is not None and email in bloom:
+                return True
+        latest = db.session.scalar(select(func.max(User.id))) or 0
+        if bloom is None or latest > high_water:
+            bloom = self._top_up(latest)
+        with self.lock:
+            return email in bloom
+
+
+registered_emails = RegisteredEmails()
+
+
+def bump_table_versions(*tables):
+    """Invalidate cached listings that read from ``tables``.
+
+    ORM writes are picked up by the ``after_flush`` hook below; Core
+    ``insert``/``update`` statements bypass it and must call this directly.
+    """
+    _bump_table_versions(db.session.connection(), tables)
+
+
+def _bump_table_versions(connection, tables):
+    dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+    versions = TableVersion.__table__
+    for table in sorted(tables):
+        stmt = dialect.insert(versions).values(table_name=table, version=1)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[versions.c.table_name],
+                set_={"version": versions.c.version + 1},
+            )
+        )
+
+
+@event.listens_for(Session, "after_flush")
+def bump_flushed_table_versions(session, flush_context):
+    tables = {
+        obj.__table__.name
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if not isinstance(obj, TableVersion)
+    }
+    if tables:
+        _bump_table_versions(session.connection(), tables)
+
+
+def listing_etag():
+    """ETag for the current listing request.
+
+    SerializerMixin follows relationships from every model into the others,
+    so any listing can change with a write to any table.
+    """
+    rows = db.session.execute(
+        select(TableVersion.table_name, TableVersion.version)
+    ).all()
+    versions = ",".join(f"{name}={version}" for name, version in sorted(rows))
+    key = f"{versions}:{request.full_path}".encode("utf-8")
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+
+STREAM_BATCH_SIZE = 500
+
+
+def stream_page(key, rows, meta, cursor=None):
+    """Stream ``rows`` as a JSON object without building the list in memory.
+
+    Rows are encoded one at a time as they come off the cursor. When
+    ``cursor`` names a column, ``next_after`` in ``meta`` is filled from the
+    last row sent so keyset clients can request the following page.
+
+    Views returning this must stay sync: ``stream_with_context`` re-pushes
+    the request context from the WSGI thread, which fails if the context was
+    captured on asgiref's event loop thread inside an ``async def`` view.
+    """
+
+    def generate():
+        yield b'{"' + key.encode("utf-8") + b'":['
+        last = None
+        for row in rows:
+            if last is not None:
+                yield b","
+            yield app.json.encode(row.to_dict())
+            last = row
+        if cursor:
+            meta["next_after"] = getattr(last, cursor) if last is not None else None
+        yield b"]," + app.json.encode(meta)[1:]
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
+def paginate(query, key, pk):
+    """Stream one page of ``query`` serialized under ``key``.
+
+    Passing ``?after=<id>`` switches to keyset pagination, which skips the
+    COUNT(*) and OFFSET scan that plain page numbers need. Until the data
+    changes, clients sending the page's ETag get an empty 304 instead.
+    """
+    try:
+        args = PageArgs.model_validate(request.args.to_dict())
+    except ValidationError as exc:
+        return validation_error(exc)
+
+    etag = listing_etag()
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = _stream_page_of(query, key, pk, args)
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
+
+def _stream_page_of(query, key, pk, args):
+    per_page = args.per_page
+    query = query.order_by(pk)
+
+    if args.after is not None:
+        rows = query.filter(pk > args.after).limit(per_page)
+        return stream_page(
+            key,
+            rows.yield_per(STREAM_BATCH_SIZE),
+            {"per_page": per_page},
+            cursor=pk.key,
+        )
+
+    total = query.order_by(None).count()
+    rows = query.limit(per_page).offset((args.page - 1) * per_page)
+    return stream_page(
+        key,
+        rows.yield_per(STREAM_BATCH_SIZE),
+        {"page": args.page, "per_page": per_page, "total": total},
+    )
 
-    def delete(self, order_id):
-        order = Order.query.get(order_id)
-        if not order:
-            return {"error": "Order not found"}, 404
-        db.session.delete(order)
+
+def patch_row(model, pk, row_id, schema, key):
+    """Apply the fields of the JSON body that ``schema`` allows to one row.
+
+    Runs a single ``UPDATE ... RETURNING`` instead of loading the entity and
+    setting attributes one by one, and responds with the updated row under
+    ``key``.
+    """
+    data = request.get_json(silent=True)
+    try:
+        fields = schema.model_validate(data if isinstance(data, dict) else {})
+    except ValidationError as exc:
+        return validation_error(exc)
+    updates = fields.model_dump(exclude_unset=True)
+
+    columns = model.__table__.c
+    if updates:
+        stmt = update(model).where(pk == row_id).values(**updates)
+        stmt = stmt.returning(*columns)
+    else:
+        stmt = select(*columns).where(pk == row_id)
+    row = db.session.execute(stmt).mappings().first()
+    if row is None:
+        db.session.rollback()
+        return {"error": f"{key.capitalize()} not found"}, 404
+    row = column_dict(model, row)
+
+    if updates:
+        bump_table_versions(model.__tablename__)
         db.session.commit()
-        return {"message": "Order successfully deleted"}, 200
+    return {"message": f"{key.capitalize()} updated", key: row}, 200
+
+
+def json_body_required(view):
+    """Reject requests without a JSON body before ``view`` runs.
+
+    The wrapper is async only for async views, so a sync view does not pay
+    for an event loop per request.
+    """
+    if asyncio.iscoroutinefunction(view):
+
+        @functools.wraps(view)
+        async def async_wrapper(*args, **kwargs):
+            if not request.is_json:
+                return {"error": "Invalid JSON format"}, 400
+            return await view(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not request.is_json:
+            return {"error": "Invalid JSON format"}, 400
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+@api.route("/")
+def index():
+    return {"index": "Welcome to Sendit"}
 
 
-class ParcelResource(Resource):
-    def post(self):
-        data = request.get_json()
-        new_parcel = Parcel(
-            weight=data["weight"],
-            dimensions=data["dimensions"],
-            description=data["description"],
+@api.route("/users", methods=["POST"])
+@api.route("/users/signup", methods=["POST"])
+@json_body_required
+async def register():
+    try:
+        data = SignupIn.model_validate(request.get_json())
+    except ValidationError as exc:
+        return validation_error(exc)
+    email = data.email
+
+    existing = await run_in_thread(
+        lambda: User.query.filter(func.lower(User.email) == email).first()
+    )
+    if existing:
+        return {"error": "Email already exists"}, 400
+
+    hashed_password = await hash_password(data.password)
+    new_user = User(
+        username=data.username,
+        email=email,
+        role=data.role,
+        hashed_password=hashed_password,
+    )
+    db.session.add(new_user)
+    await run_in_thread(db.session.commit)
+    registered_emails.add(new_user.email)
+    logger.info("User created: %s", new_user.username)
+    return {"user": new_user.to_dict()}, 201
+
+
+@api.route("/users/login", methods=["POST"])
+@json_body_required
+async def login():
+    try:
+        data = LoginIn.model_validate(request.get_json())
+    except ValidationError as exc:
+        return validation_error(exc)
+    email, password = data.email, data.password
+
+    user = None
+    if email and await run_in_thread(registered_emails.might_exist, email):
+        user = await run_in_thread(
+            lambda: User.query.filter(func.lower(User.email) == email).first()
         )
-        db.session.add(new_parcel)
-        db.session.commit()
-        return {"message": "Parcel created", "parcel": new_parcel.to_dict()}, 201
-
-    def get(self):
-        parcels = Parcel.query.all()
-        return {"parcels": [parcel.to_dict() for parcel in parcels]}
-
-    def patch(self, parcel_id):
-        parcel = Parcel.query.get(parcel_id)
-        if not parcel:
-            return {"error": "Parcel not found"}, 404
-        data = request.get_json()
-        if "weight" in data:
-            parcel.weight = data["weight"]
-        if "dimensions" in data:
-            parcel.dimensions = data["dimensions"]
-        if "description" in data:
-            parcel.description = data["description"]
-        db.session.commit()
-        return {"message": "Parcel updated", "parcel": parcel.to_dict()}, 200
+    if user is None:
+        # Spend the same bcrypt work as a real check so response times do
+        # not reveal which emails are registered
+        await check_password(DUMMY_HASH, password)
+        return {"error": "Invalid credentials"}, 401
 
-    def delete(self, parcel_id):
-        parcel = Parcel.query.get(parcel_id)
-        if not parcel:
-            return {"error": "Parcel not found"}, 404
-        db.session.delete(parcel)
-        db.session.commit()
-        return {"message": "Parcel successfully deleted"}, 200
-
-
-class ProfileResource(Resource):
-    def get(self, profile_id):
-        profile = Profile.query.get(profile_id)
-        if profile:
-            return {"profile": profile.to_dict()}
-        return {"error": "Profile not found"}, 404
-
-    def patch(self, profile_id):
-        profile = Profile.query.get(profile_id)
-        if not profile:
-            return {"error": "Profile not found"}, 404
-        data = request.get_json()
-        if "address" in data:
-            profile.address = data["address"]
-        if "phone_number" in data:
-            profile.phone_number = data["phone_number"]
-        db.session.commit()
-        return {"message": "Profile updated", "profile": profile.to_dict()}, 200
+    if await check_password(user.hashed_password, password):
+        if is_legacy_hash(user.hashed_password):
+            user.hashed_password = await hash_password(password)
+            await run_in_thread(db.session.commit)
+
+        session["user_id"] = user.id
+        now = datetime.datetime.now(datetime.timezone.utc)
+        token = encode_token(user.id, now + ACCESS_TOKEN_TTL)
+        refresh_token = encode_token(user.id, now + REFRESH_TOKEN_TTL)
+
+        return {"token": token, "refresh_token": refresh_token}, 200
+
+    return {"error": "Invalid credentials"}, 401
+
+
+@api.route("/users/logout", methods=["POST"])
+@json_body_required
+def logout():
+    session.pop("user_id", None)
+    return {"message": "Logged out successfully"}, 200
+
+
+@api.route("/orders", methods=["POST"])
+def create_order():
+    data = request.get_json()
+    new_order = Order(
+        user_id=data["user_id"],
+        parcel_id=data["parcel_id"],
+        origin=data["origin"],
+        destination=data["destination"],
+        status=data.get("status", "pending"),
+    )
+    db.session.add(new_order)
+    db.session.commit()
+    return {"message": "Order created", "order": new_order.to_dict()}, 201
+
+
+@api.route("/orders", methods=["GET"])
+def list_orders():
+    orders = Order.query.options(
+        *eager(selectinload(Order.user), selectinload(Order.feedback))
+    )
+    return paginate(orders, "orders", Order.order_id)
+
+
+@api.route("/orders/<int:order_id>", methods=["GET"])
+def get_order(order_id):
+    # Project the columns straight into a mapping: no ORM identity map
+    # entry and no relationship loads for a single-row read
+    order = (
+        db.session.execute(select(*Order.__table__.c).where(Order.order_id == order_id))
+        .mappings()
+        .first()
+    )
+    if order:
+        return {"order": column_dict(Order, order)}
+    return {"error": "Order not found"}, 404
+
+
+@api.route("/orders/<int:order_id>", methods=["PATCH"])
+def update_order(order_id):
+    return patch_row(Order, Order.order_id, order_id, OrderPatch, "order")
+
+
+@api.route("/orders/<int:order_id>", methods=["DELETE"])
+def delete_order(order_id):
+    order = Order.query.get(order_id)
+    if not order:
+        return {"error": "Order not found"}, 404
+    db.session.delete(order)
+    db.session.commit()
+    return {"message": "Order successfully deleted"}, 200
+
+
+@api.route("/parcels", methods=["POST"])
+def create_parcel():
+    data = request.get_json()
+    new_parcel = Parcel(
+        weight=data["weight"],
+        dimensions=data["dimensions"],
+        description=data["description"],
+    )
+    db.session.add(new_parcel)
+    db.session.commit()
+    return {"message": "Parcel created", "parcel": new_parcel.to_dict()}, 201
+
+
+@api.route("/parcels", methods=["GET"])
+def list_parcels():
+    parcels = Parcel.query.options(*eager(selectinload(Parcel.user)))
+    return paginate(parcels, "parcels", Parcel.id)
 
 
-class FeedbackResource(Resource):
-    def post(self):
-        data = request.get_json()
-        new_feedback = Feedback(
-            user_id=data["user_id"],
-            order_id=data["order_id"],
-            feedback=data["feedback"],
+@api.route("/parcels/<int:parcel_id>", methods=["PATCH"])
+def update_parcel(parcel_id):
+    return patch_row(Parcel, Parcel.id, parcel_id, ParcelPatch, "parcel")
+
+
+@api.route("/parcels/<int:parcel_id>", methods=["DELETE"])
+def delete_parcel(parcel_id):
+    parcel = Parcel.query.get(parcel_id)
+    if not parcel:
+        return {"error": "Parcel not found"}, 404
+    db.session.delete(parcel)
+    db.session.commit()
+    return {"message": "Parcel successfully deleted"}, 200
+
+
+@api.route("/profiles/<int:profile_id>", methods=["GET"])
+def get_profile(profile_id):
+    profile = (
+        db.session.execute(select(*Profile.__table__.c).where(Profile.id == profile_id))
+        .mappings()
+        .first()
+    )
+    if profile:
+        return {"profile": column_dict(Profile, profile)}
+    return {"error": "Profile not found"}, 404
+
+
+@api.route("/profiles/<int:profile_id>", methods=["PATCH"])
+def update_profile(profile_id):
+    return patch_row(Profile, Profile.id, profile_id, ProfilePatch, "profile")
+
+
+@api.route("/feedbacks", methods=["POST"])
+def create_feedback():
+    data = request.get_json()
+    new_feedback = Feedback(
+        user_id=data["user_id"],
+        order_id=data["order_id"],
+        feedback=data["feedback"],
+    )
+    db.session.add(new_feedback)
+    db.session.commit()
+    return {
+        "message": "Feedback submitted",
+        "feedback": new_feedback.to_dict(),
+    }, 201
+
+
+@api.route("/feedbacks", methods=["GET"])
+def list_feedbacks():
+    feedbacks = Feedback.query.options(
+        *eager(
+            selectinload(Feedback.order),
+            selectinload(Feedback.order).selectinload(Order.user),
         )
-        db.session.add(new_feedback)
+    )
+    return paginate(feedbacks, "feedbacks", Feedback.id)
+
+
+MAX_BULK_ROWS = 1000
+
+
+def bulk_insert(model, key, item_schema):
+    """Create many rows from one request with a single multi-row INSERT.
+
+    ``key`` names the request field holding the list; each item is validated
+    against ``item_schema`` before anything is written.
+    """
+    data = request.get_json(silent=True) or {}
+    items = data.get(key) if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        return {"error": f"Expected a non-empty '{key}' list"}, 400
+    if len(items) > MAX_BULK_ROWS:
+        return {"error": f"At most {MAX_BULK_ROWS} {key} per request"}, 400
+
+    rows = []
+    for index, item in enumerate(items):
+        try:
+            rows.append(item_schema.model_validate(item).model_dump())
+        except ValidationError as exc:
+            return validation_error(exc, prefix=(key, index))
+
+    try:
+        db.session.execute(insert(model), rows)
+        bump_table_versions(model.__tablename__)
         db.session.commit()
+    except IntegrityError as exc:
+        db.session.rollback()
+        logger.warning("Bulk insert of %s rejected: %s", key, exc.orig)
         return {
-            "message": "Feedback submitted",
-            "feedback": new_feedback.to_dict(),
-        }, 201
-
-    def get(self):
-        feedbacks = Feedback.query.all()
-        return {"feedbacks": [feedback.to_dict() for feedback in feedbacks]}
-
-
-api.add_resource(Index, "/")
-api.add_resource(
-    UserResource,
-    "/users",
-    "/users/login",
-    "/users/signup",
-    "/users/logout",
-    "/users/<int:user_id>",
-)
-api.add_resource(OrderResource, "/orders", "/orders/<int:order_id>")
-api.add_resource(ParcelResource, "/parcels", "/parcels/<int:parcel_id>")
-api.add_resource(ProfileResource, "/profiles/<int:profile_id>")
-api.add_resource(FeedbackResource, "/feedbacks", "/feedbacks/<int:feedback_id>")
+            "error": f"Could not create {key}: a referenced record does not exist"
+            " or a value is already taken"
+        }, 400
+    return {"message": f"{len(rows)} {key} created", "count": len(rows)}, 201
+
+
+@api.route("/orders/bulk", methods=["POST"])
+def bulk_create_orders():
+    return bulk_insert(Order, "orders", OrderBulkItem)
+
+
+@api.route("/parcels/bulk", methods=["POST"])
+def bulk_create_parcels():
+    return bulk_insert(Parcel, "parcels", ParcelBulkItem)
+
+
+@api.route("/feedbacks/bulk", methods=["POST"])
+def bulk_create_feedbacks():
+    return bulk_insert(Feedback, "feedbacks", FeedbackBulkItem)
+
+
+app.register_blueprint(api)
 
 if __name__ == "__main__":
-    app.run(port=5000, debug=True)
+    # Local development only; production runs under gunicorn (gunicorn.conf.py)
+    app.run(port=5000, debug=os.getenv("FLASK_DEBUG") == "1")
@@ -1,4 +1,4 @@
-from app import app, db
+from app import app, db, bump_table_versions
 from models import User, Order, Parcel, Profile, Feedback
 
 with app.app_context():
@@ -8,6 +8,7 @@ with app.app_context():
     db.session.query(Order).delete()
     db.session.query(Profile).delete()
     db.session.query(User).delete()
+    bump_table_versions("feedback", "parcels", "orders", "profiles", "users")
 
     # Commit the changes
     db.session.commit()
@@ -0,0 +1,25 @@
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# Import the app (and calibrate bcrypt) once in the master, then fork
+preload_app = True
+
+
+def post_fork(server, worker):
+    # Split the cores between the workers so that together they hash at most
+    # one password per core
+    os.environ.setdefault(
+        "BCRYPT_POOL_SIZE",
+        str(max(1, multiprocessing.cpu_count() // server.cfg.workers)),
+    )
+    from app import app, db, reset_bcrypt_pool
+
+    reset_bcrypt_pool()
+    # Connections opened by the master must not be shared between workers
+    with app.app_context():
+        db.engine.dispose(close=False)
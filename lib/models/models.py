@@ -1,17 +1,20 @@
+import re
+
 from flask_login import UserMixin
 from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey
+from sqlalchemy import Index, func
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy_serializer import SerializerMixin
 from .database import db
 
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+
 
 class User(db.Model, UserMixin, SerializerMixin):
     __tablename__ = "users"
-    serialize_rules = (
-        "-orders.user",
-        "-parcels.user",
-        "-password",
-    )
+    # Nested under orders/parcels/feedback, a user is only its own columns:
+    # no relationships to lazy-load and no password hash
+    serialize_only = ("id", "username", "email", "role")
 
     id = Column(Integer, primary_key=True)
     username = Column(String(150), nullable=False, unique=True)
@@ -22,6 +25,8 @@ class User(db.Model, UserMixin, SerializerMixin):
     parcels = relationship("Parcel", backref="user", lazy=True)
     profiles = relationship("Profile", backref="user", lazy=True)
 
+    __table_args__ = (Index("ix_users_email_lower", func.lower(email), unique=True),)
+
     def __init__(self, email, username, role, hashed_password):
         from app import bcrypt
 
@@ -32,10 +37,7 @@ class User(db.Model, UserMixin, SerializerMixin):
 
     @validates("email")
     def validate_email(self, key, email):
-        import re
-
-        regex = r"^\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        if not re.match(regex, email):
+        if not EMAIL_RE.fullmatch(email):
             raise ValueError("Invalid email address")
         return email
 
@@ -112,3 +114,13 @@ class Feedback(db.Model, SerializerMixin):
 
     def __repr__(self):
         return f"<Feedback(id={self.id}, rating={self.rating})>"
+
+
+class TableVersion(db.Model):
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(64), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<TableVersion(table_name={self.table_name}, version={self.version})>"
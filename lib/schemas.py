@@ -0,0 +1,107 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from models.models import EMAIL_RE
+
+ALLOWED_ROLES = frozenset({"user", "customer", "admin"})
+DEFAULT_ROLE = "user"
+
+
+def normalize_email(email):
+    return email.strip().lower()
+
+
+class SignupIn(BaseModel):
+    username: str = Field(min_length=1)
+    email: str = Field(min_length=1)
+    password: str = Field(min_length=1)
+    role: str = DEFAULT_ROLE
+
+    @field_validator("email")
+    @classmethod
+    def check_email(cls, email):
+        # Checked here as well as on the model so a malformed address is
+        # rejected before any bcrypt work
+        email = normalize_email(email)
+        if not EMAIL_RE.fullmatch(email):
+            raise ValueError("Invalid email address")
+        return email
+
+    @field_validator("role")
+    @classmethod
+    def check_role(cls, role):
+        if role not in ALLOWED_ROLES:
+            raise ValueError(f"Role must be one of: {', '.join(sorted(ALLOWED_ROLES))}")
+        return role
+
+
+class LoginIn(BaseModel):
+    email: str
+    password: str
+
+    @field_validator("email")
+    @classmethod
+    def normalize(cls, email):
+        return normalize_email(email)
+
+
+class OrderBulkItem(BaseModel):
+    pickup_address: str = Field(min_length=1)
+    delivery_address: str = Field(min_length=1)
+    user_id: int
+    status: str = "pending"
+
+
+class ParcelBulkItem(BaseModel):
+    pickup_location: str = Field(min_length=1)
+    destination: str = Field(min_length=1)
+    weight: float
+    user_id: Optional[int] = None
+    price: Optional[float] = None
+    description: Optional[str] = None
+
+
+class FeedbackBulkItem(BaseModel):
+    rating: int
+    comment: str = Field(min_length=1)
+    order_id: int
+
+
+# Patch fields default to None only so they can be left out: unset fields are
+# dropped with ``exclude_unset``, and an explicit null for a required column
+# still fails validation.
+class OrderPatch(BaseModel):
+    status: str = Field(None, min_length=1, max_length=50)
+
+
+class ParcelPatch(BaseModel):
+    weight: float = None
+    description: Optional[str] = None
+
+
+class ProfilePatch(BaseModel):
+    location: Optional[str] = None
+    profile_picture: Optional[str] = Field(None, max_length=255)
+
+
+class PageArgs(BaseModel):
+    page: int = Field(1, ge=1)
+    per_page: int = Field(20, ge=1, le=100)
+    after: Optional[int] = Field(None, ge=0)
+
+
+def validation_error(exc, prefix=()):
+    """Build a 400 response body from a pydantic ``ValidationError``.
+
+    ``prefix`` is prepended to each field path, e.g. ``("orders", 3)`` for
+    the fourth item of a bulk request.
+    """
+    details = [
+        {
+            "field": ".".join(str(part) for part in (*prefix, *error["loc"])),
+            "message": error["msg"],
+        }
+        for error in exc.errors()
+    ]
+    return {"error": "Invalid input", "details": details}, 400
@@ -4,7 +4,6 @@ from app import app
 from models.database import db
 from models.models import User, Order, Parcel, Profile, Feedback
 from sqlalchemy.sql import text
-import hashlib
 
 fake = Faker()
 bcrypt = Bcrypt(app)
@@ -27,7 +26,7 @@ def seed_data():
         users = []
         for _ in range(5):
             password = fake.password(length=12)
-            hashed_password = hashlib.sha256(password.encode("utf-8")).hexdigest()
+            hashed_password = bcrypt.generate_password_hash(password).decode("utf-8")
             user = User(
                 username=fake.user_name(),
                 email=fake.unique.email(),